@@ -175,3 +175,21 @@ def check_access(schedule: dtypes.ScheduleType, *descs: data.Data):
         if not dtypes.can_access(schedule, desc.storage):
             raise ValueError(
                 f"Schedule mismatch: {schedule} cannot access {desc.storage}")
+
+
+def tile_map(sdfg, map_entry, tile_sizes):
+    """ Tiles a map with MapTiling, leaving dimensions with a tile size of
+        None or 1 untiled. Does nothing if no dimension is tiled.
+
+        :param sdfg: the SDFG containing the map.
+        :param map_entry: the entry node of the map to tile.
+        :param tile_sizes: a tile size per map dimension.
+    """
+    tile_sizes = tuple(t or 1 for t in tile_sizes)
+    if all(t == 1 for t in tile_sizes):
+        return
+    # Avoid import loop
+    from dace.transformation.dataflow import MapTiling
+    MapTiling.apply_to(sdfg,
+                       map_entry=map_entry,
+                       options={'tile_sizes': tile_sizes})
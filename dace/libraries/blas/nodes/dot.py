@@ -71,6 +71,139 @@ class ExpandDotPure(ExpandTransformation):
         return sdfg
 
 
+@dace.library.expansion
+class ExpandDotPureTree(ExpandTransformation):
+    """
+    Backend-agnostic expansion of DOT that accumulates into a number of
+    independent partial sums, then combines them with a pairwise tree.
+    This breaks the loop-carried dependency of the naive expansion, and lets
+    the compiler keep the partial sums in vector registers.
+    """
+
+    environments = []
+
+    @staticmethod
+    def expansion(node,
+                  parent_state,
+                  parent_sdfg,
+                  n=None,
+                  partial_sums=8,
+                  **kwargs):
+
+        (desc_x, stride_x), (desc_y, stride_y), desc_res, sz = node.validate(
+            parent_sdfg, parent_state)
+
+        n = n or node.n or sz
+
+        if desc_x.dtype.veclen > 1 or desc_y.dtype.veclen > 1:
+            raise NotImplementedError(
+                "Pure expansion not implemented for vector types.")
+        if partial_sums < 2 or partial_sums & (partial_sums - 1) != 0:
+            raise ValueError("Number of partial sums must be a power of two "
+                             "larger than one, got {}.".format(partial_sums))
+
+        dtype_x = desc_x.dtype.type
+        dtype_y = desc_y.dtype.type
+        dtype_result = desc_res.dtype.type
+        sdfg = dace.SDFG(node.label + "_sdfg")
+
+        sdfg.add_array("_x", [n],
+                       dtype_x,
+                       strides=[stride_x],
+                       storage=desc_x.storage)
+        sdfg.add_array("_y", [n],
+                       dtype_y,
+                       strides=[stride_y],
+                       storage=desc_y.storage)
+        sdfg.add_array("_result", [1], dtype_result, storage=desc_res.storage)
+        sdfg.add_array("_partial", [partial_sums],
+                       dtype_result,
+                       storage=dtypes.StorageType.Register,
+                       transient=True)
+
+        num_blocks = f"int_floor({n}, {partial_sums})"
+
+        init_state = sdfg.add_state(node.label + "_initstate")
+        state = sdfg.add_state_after(init_state, node.label + "_state")
+
+        # Initialize the partial sums
+        init_state.add_mapped_tasklet("dot_init",
+                                      {"__k": f"0:{partial_sums}"}, {},
+                                      "_out = 0",
+                                      {"_out": dace.Memlet("_partial[__k]")},
+                                      schedule=dtypes.ScheduleType.Unrolled,
+                                      external_edges=True)
+
+        # Accumulate blocks of the input into independent partial sums. The
+        # outer map is sequential, so the accumulation does not need atomics
+        x_read = state.add_read("_x")
+        y_read = state.add_read("_y")
+        partial_write = state.add_write("_partial")
+        block_entry, block_exit = state.add_map(
+            "dot_blocks", {"__b": f"0:{num_blocks}"},
+            schedule=dtypes.ScheduleType.Sequential)
+        lane_entry, lane_exit = state.add_map(
+            "dot_lanes", {"__k": f"0:{partial_sums}"},
+            schedule=dtypes.ScheduleType.Unrolled)
+        tasklet = state.add_tasklet("dot", {"__x", "__y"}, {"__out"},
+                                    "__out = __x * __y")
+        state.add_memlet_path(
+            x_read,
+            block_entry,
+            lane_entry,
+            tasklet,
+            dst_conn="__x",
+            memlet=dace.Memlet(f"_x[__b * {partial_sums} + __k]"))
+        state.add_memlet_path(
+            y_read,
+            block_entry,
+            lane_entry,
+            tasklet,
+            dst_conn="__y",
+            memlet=dace.Memlet(f"_y[__b * {partial_sums} + __k]"))
+        state.add_memlet_path(tasklet,
+                              lane_exit,
+                              block_exit,
+                              partial_write,
+                              src_conn="__out",
+                              memlet=dace.Memlet("_partial[__k]",
+                                                 wcr="lambda x, y: x + y"))
+
+        # Add the remainder that does not fill a full block
+        tail_state = sdfg.add_state_after(state, node.label + "_tail")
+        tail_state.add_mapped_tasklet(
+            "dot_tail", {"__i": f"{num_blocks} * {partial_sums}:{n}"}, {
+                "__x": dace.Memlet("_x[__i]"),
+                "__y": dace.Memlet("_y[__i]")
+            },
+            "__out = __x * __y",
+            {"__out": dace.Memlet("_partial[0]", wcr="lambda x, y: x + y")},
+            schedule=dtypes.ScheduleType.Sequential,
+            external_edges=True)
+
+        # Combine the partial sums pairwise, halving their number at every
+        # level, and write the last level to the result
+        prev_state = tail_state
+        width = partial_sums // 2
+        while width >= 1:
+            reduce_state = sdfg.add_state_after(
+                prev_state, node.label + f"_reduce_{width}")
+            out_memlet = (dace.Memlet("_result[0]") if width == 1 else
+                          dace.Memlet("_partial[__k]"))
+            reduce_state.add_mapped_tasklet(
+                f"dot_reduce_{width}", {"__k": f"0:{width}"}, {
+                    "__a": dace.Memlet("_partial[__k]"),
+                    "__b": dace.Memlet(f"_partial[__k + {width}]")
+                },
+                "__out = __a + __b", {"__out": out_memlet},
+                schedule=dtypes.ScheduleType.Unrolled,
+                external_edges=True)
+            prev_state = reduce_state
+            width //= 2
+
+        return sdfg
+
+
 @dace.library.expansion
 class ExpandDotOpenBLAS(ExpandTransformation):
 
@@ -552,6 +685,7 @@ class Dot(dace.sdfg.nodes.LibraryNode):
     # Global properties
     implementations = {
         "pure": ExpandDotPure,
+        "pure_tree": ExpandDotPureTree,
         "OpenBLAS": ExpandDotOpenBLAS,
         "MKL": ExpandDotMKL,
         "cuBLAS": ExpandDotCuBLAS,
@@ -20,7 +20,22 @@ class ExpandGemvPure(ExpandTransformation):
     environments = []
 
     @staticmethod
-    def expansion(node, parent_state, parent_sdfg, **kwargs):
+    def expansion(node,
+                  parent_state,
+                  parent_sdfg,
+                  tile_size_x=None,
+                  tile_size_y=None,
+                  **kwargs):
+        """
+        :param node: Node to expand.
+        :param parent_state: State that the node is in.
+        :param parent_sdfg: SDFG that the node is in.
+        :param tile_size_x: Number of x elements (the reduced dimension)
+                            per tile. None or 1 reduces over all of x at
+                            once.
+        :param tile_size_y: Number of y elements (the output dimension) per
+                            tile. None or 1 leaves the outputs untiled.
+        """
         node.validate(parent_sdfg, parent_state)
         sdfg = dace.SDFG(node.label + "_sdfg")
         ((edge_a, outer_array_a, shape_a, strides_a), (edge_x, outer_array_x,
@@ -101,23 +116,28 @@ class ExpandGemvPure(ExpandTransformation):
             external_edges=True)
 
         # Multiplication map
-        state.add_mapped_tasklet("_GEMV_", {
-            "__i%d" % i: "0:%s" % s
-            for i, s in enumerate([N, M])
-        }, {
-            "__A":
-            dace.Memlet(
-                "_A[{}]".format("__i1, __i0" if node.transA else "__i0, __i1")),
-            "__x":
-            dace.Memlet("_x[__i1]")
-        },
-                                 mul_program, {
-                                     "__out":
-                                     dace.Memlet(f"{mul_out}[__i0]",
-                                                 wcr="lambda x, y: x + y")
-                                 },
-                                 external_edges=True,
-                                 output_nodes=output_nodes)
+        _, gemv_entry, _ = state.add_mapped_tasklet(
+            "_GEMV_", {
+                "__i%d" % i: "0:%s" % s
+                for i, s in enumerate([N, M])
+            }, {
+                "__A":
+                dace.Memlet("_A[{}]".format(
+                    "__i1, __i0" if node.transA else "__i0, __i1")),
+                "__x":
+                dace.Memlet("_x[__i1]")
+            },
+            mul_program, {
+                "__out": dace.Memlet(f"{mul_out}[__i0]",
+                                     wcr="lambda x, y: x + y")
+            },
+            external_edges=True,
+            output_nodes=output_nodes)
+
+        # The map iterates over y first and x second. With transA, the inner
+        # x loop walks down the columns of A, so blocking both dimensions
+        # keeps the touched rows of A and the partial sums of y in cache
+        blas_helpers.tile_map(sdfg, gemv_entry, (tile_size_y, tile_size_x))
 
         add_program = "__y_out = ({} * __y_in) + __tmp".format(node.beta)
 
@@ -5,12 +5,14 @@ from dace.transformation.transformation import ExpandTransformation
 from dace.frontend.common import op_repository as oprepo
 from dace.sdfg.nodes import LibraryNode
 from dace.libraries.blas.nodes.matmul import _get_matmul_operands
+from dace.libraries.blas import blas_helpers, environments
 import dace.library as library
 from dace.sdfg import SDFG, SDFGState, nodes
 from dace import data as dt, memlet as mm, subsets as sbs
 import dace
 import copy
 import numpy as np
+import warnings
 
 import dace.library
 import dace.properties
@@ -20,6 +22,14 @@ from dace import dtypes
 from dace.memlet import Memlet
 
 
+def _squeezed_size(subset):
+    """
+    Returns the size of a subset with all unit dimensions removed, matching
+    ``subset.squeeze()`` without having to copy and modify the subset.
+    """
+    return [d for d in subset.size() if d != 1] or [1]
+
+
 @library.expansion
 class ExpandGerPure(ExpandTransformation):
     """
@@ -29,7 +39,21 @@ class ExpandGerPure(ExpandTransformation):
     environments = []
 
     @staticmethod
-    def expansion(node, parent_state, parent_sdfg, **kwargs):
+    def expansion(node,
+                  parent_state,
+                  parent_sdfg,
+                  tile_size_x=None,
+                  tile_size_y=None,
+                  **kwargs):
+        """
+        :param node: Node to expand.
+        :param parent_state: State that the node is in.
+        :param parent_sdfg: SDFG that the node is in.
+        :param tile_size_x: Rows of A (elements of x) per tile. None or 1
+                            leaves the rows untiled.
+        :param tile_size_y: Columns of A (elements of y) per tile. None or 1
+                            leaves the columns untiled.
+        """
         node.validate(parent_sdfg, parent_state)
         inputs = ('_A', '_x', '_y')
         outputs = ('_res', )
@@ -69,8 +93,16 @@ class ExpandGerPure(ExpandTransformation):
             newdesc.transient = False
             sdfg.add_datadesc(name, newdesc)
 
+        # Avoid the extra multiplication in the common rank-1 update A+xy^T
+        if node.alpha == 1:
+            code = 'aout = xin * yin + a'
+        elif node.alpha == -1:
+            code = 'aout = a - xin * yin'
+        else:
+            code = 'aout = alpha * xin * yin + a'
+
         state = sdfg.add_state()
-        state.add_mapped_tasklet(
+        _, map_entry, _ = state.add_mapped_tasklet(
             'ger',
             {
                 '_i': f'0:M',
@@ -81,11 +113,15 @@ class ExpandGerPure(ExpandTransformation):
                 'xin': mm.Memlet('_x[_i]'),
                 'yin': mm.Memlet(f'_y[_j]')
             },
-            f'aout = alpha * xin * yin + a',
+            code,
             {'aout': mm.Memlet('_res[_i, _j]')},
             external_edges=True,
         )
 
+        # Every element of A is touched once, so tiling only helps by keeping
+        # a slice of y in cache while it is combined with a block of rows
+        blas_helpers.tile_map(sdfg, map_entry, (tile_size_x, tile_size_y))
+
         outshape = arrays['_res'].shape
         nsdfg_node = nodes.NestedSDFG(node.label, sdfg, set(inputs),
                                       set(outputs), {
@@ -97,6 +133,107 @@ class ExpandGerPure(ExpandTransformation):
         return nsdfg_node
 
 
+@dace.library.expansion
+class ExpandGerOpenBLAS(ExpandTransformation):
+
+    environments = [environments.openblas.OpenBLAS]
+
+    @staticmethod
+    def expansion(node, parent_state, parent_sdfg, **kwargs):
+        from dace.sdfg.scope import is_devicelevel_gpu
+        if is_devicelevel_gpu(parent_sdfg, parent_state, node):
+            return ExpandGerPure.expansion(node, parent_state, parent_sdfg,
+                                           **kwargs)
+
+        desc_a, desc_x, desc_y = node.validate(parent_sdfg, parent_state)
+        desc_res = parent_sdfg.arrays[next(
+            parent_state.out_edges_by_connector(node, '_res')).data.data]
+        if not all(
+                isinstance(desc, dt.Array)
+                for desc in (desc_a, desc_x, desc_y, desc_res)):
+            warnings.warn('BLAS GER requires array inputs, falling back to '
+                          'pure.')
+            return ExpandGerPure.expansion(node, parent_state, parent_sdfg,
+                                           **kwargs)
+
+        dtype = desc_x.dtype.base_type
+        if any(desc.dtype.veclen != 1
+               for desc in (desc_a, desc_x, desc_y, desc_res)):
+            warnings.warn('Vector GER not supported, falling back to pure.')
+            return ExpandGerPure.expansion(node, parent_state, parent_sdfg,
+                                           **kwargs)
+        if dtype not in (dtypes.float32, dtypes.float64):
+            warnings.warn(f'BLAS GER not supported for {dtype}, falling back '
+                          'to pure.')
+            return ExpandGerPure.expansion(node, parent_state, parent_sdfg,
+                                           **kwargs)
+
+        # Take sizes and strides from the memlets rather than the containers,
+        # as the connectors may refer to a slice of a larger array
+        ((_, _, _, strides_a), (_, _, _, strides_x),
+         (edge_res, _, _, strides_res)) = _get_matmul_operands(
+             node,
+             parent_state,
+             parent_sdfg,
+             name_lhs='_A',
+             name_rhs='_x',
+             name_out='_res')
+        (_, _, _, strides_y), _, _ = _get_matmul_operands(node,
+                                                          parent_state,
+                                                          parent_sdfg,
+                                                          name_lhs='_y',
+                                                          name_rhs='_x',
+                                                          name_out='_res')
+        if (len(strides_a) != 2 or len(strides_res) != 2
+                or len(strides_x) != 1 or len(strides_y) != 1):
+            warnings.warn('BLAS GER requires a two-dimensional matrix and '
+                          'one-dimensional vectors, falling back to pure.')
+            return ExpandGerPure.expansion(node, parent_state, parent_sdfg,
+                                           **kwargs)
+        if strides_a[1] != 1 or strides_res[1] != 1:
+            warnings.warn('Matrix must be contiguous in its last dimension. '
+                          'Falling back to pure expansion.')
+            return ExpandGerPure.expansion(node, parent_state, parent_sdfg,
+                                           **kwargs)
+
+        func, _, _ = blas_helpers.cublas_type_metadata(dtype)
+        func = func.lower() + 'ger'
+
+        m, n = _squeezed_size(edge_res.data.subset)
+        lda = strides_a[0]
+        ldres = strides_res[0]
+
+        # GER updates its matrix in place, so copy A into the result first
+        # unless both connectors refer to the same memory
+        code = f"""if (_res != _A) {{
+    for (int __i = 0; __i < {m}; ++__i) {{
+        for (int __j = 0; __j < {n}; ++__j) {{
+            _res[__i * {ldres} + __j] = _A[__i * {lda} + __j];
+        }}
+    }}
+}}
+cblas_{func}(CblasRowMajor, {m}, {n}, {node.alpha}, _x, {strides_x[0]},
+             _y, {strides_y[0]}, _res, {ldres});"""
+
+        tasklet = dace.sdfg.nodes.Tasklet(node.name,
+                                          node.in_connectors,
+                                          node.out_connectors,
+                                          code,
+                                          language=dace.dtypes.Language.CPP)
+
+        return tasklet
+
+
+@dace.library.expansion
+class ExpandGerMKL(ExpandTransformation):
+
+    environments = [environments.intel_mkl.IntelMKL]
+
+    @staticmethod
+    def expansion(*args, **kwargs):
+        return ExpandGerOpenBLAS.expansion(*args, **kwargs)
+
+
 @dace.library.expansion
 class ExpandGerFpga(ExpandTransformation):
     """
@@ -202,7 +339,7 @@ class ExpandGerFpga(ExpandTransformation):
         sdfg.add_array("x_local", (1, ),
                        desc_x.dtype,
                        transient=True,
-                       storage=dace.StorageType.FPGA_Local)
+                       storage=dace.StorageType.FPGA_Registers)
         x_local = state.add_access("x_local")
         subset = ("0" if isinstance(desc_x, dace.data.Stream) else
                   f"tx*{tile_size_x} + ix")
@@ -217,10 +354,16 @@ class ExpandGerFpga(ExpandTransformation):
         y_entry, y_exit = state.add_map("y", {"iy": f"0:{tile_size_y}"},
                                         schedule=dace.ScheduleType.FPGA_Device)
 
-        # Actual computation
-        compute_tasklet = state.add_tasklet(
-            "ger", {"a_in", "x_in", "y_in"}, {"a_out"},
-            f"a_out = {alpha} * x_in * y_in + a_in")
+        # Actual computation. Fold a constant alpha of 1 or -1 into the
+        # expression to save a multiplier per vector lane
+        if alpha == 1:
+            compute_code = "a_out = x_in * y_in + a_in"
+        elif alpha == -1:
+            compute_code = "a_out = a_in - x_in * y_in"
+        else:
+            compute_code = f"a_out = {alpha} * x_in * y_in + a_in"
+        compute_tasklet = state.add_tasklet("ger", {"a_in", "x_in", "y_in"},
+                                            {"a_out"}, compute_code)
 
         # Stream in A
         read_a = state.add_read("_A")
@@ -249,8 +392,11 @@ class ExpandGerFpga(ExpandTransformation):
                               dst_conn="y_in",
                               memlet=dace.Memlet(f"y_local[iy]"))
 
-        # Store result
+        # Store result, which can be streamed directly to a consumer
+        # independently of how A is read
         write_a = state.add_write("_res")
+        subset_res = ("0" if isinstance(desc_a_out, dace.data.Stream) else
+                      f"tx*{tile_size_x} + ix, ty*{tile_size_y} + iy")
         state.add_memlet_path(compute_tasklet,
                               y_exit,
                               x_exit,
@@ -258,7 +404,7 @@ class ExpandGerFpga(ExpandTransformation):
                               y_tile_exit,
                               write_a,
                               src_conn="a_out",
-                              memlet=dace.Memlet(f"_res[{subset_a}]"))
+                              memlet=dace.Memlet(f"_res[{subset_res}]"))
 
         return sdfg
 
@@ -274,7 +420,12 @@ class Ger(LibraryNode):
     """
 
     # Global properties
-    implementations = {"pure": ExpandGerPure, "FPGA": ExpandGerFpga}
+    implementations = {
+        "pure": ExpandGerPure,
+        "OpenBLAS": ExpandGerOpenBLAS,
+        "MKL": ExpandGerMKL,
+        "FPGA": ExpandGerFpga
+    }
     default_implementation = None
 
     # Object fields
@@ -328,19 +479,13 @@ class Ger(LibraryNode):
         size_y = None
         for _, _, _, dst_conn, memlet in state.in_edges(self):
             if dst_conn == "_A":
-                subset = copy.deepcopy(memlet.subset)
-                subset.squeeze()
-                size_a = subset.size()
+                size_a = _squeezed_size(memlet.subset)
                 desc_a = sdfg.arrays[memlet.data]
             if dst_conn == "_x":
-                subset = copy.deepcopy(memlet.subset)
-                subset.squeeze()
-                size_x = subset.size()
+                size_x = _squeezed_size(memlet.subset)
                 desc_x = sdfg.arrays[memlet.data]
             if dst_conn == "_y":
-                subset = copy.deepcopy(memlet.subset)
-                subset.squeeze()
-                size_y = subset.size()
+                size_y = _squeezed_size(memlet.subset)
                 desc_y = sdfg.arrays[memlet.data]
 
         if size_a is None or size_x is None:
@@ -354,7 +499,7 @@ class Ger(LibraryNode):
         if (not isinstance(desc_x, dt.Array)
                 or not isinstance(desc_y, dt.Array)
                 or not isinstance(desc_a, dt.Array)):
-            return
+            return desc_a, desc_x, desc_y
 
         if len(size_a) != 2:
             raise ValueError("A must be a matrix")
@@ -374,9 +519,11 @@ class Ger(LibraryNode):
                 "Expected exactly one output from ger rank 1 operation.")
         out_memlet = out_edges[0].data
 
-        out_subset = copy.deepcopy(out_memlet.subset)
-        out_subset.squeeze()
-        size_out = out_subset.size()
+        # The result may be streamed to a consumer
+        if not isinstance(sdfg.arrays[out_memlet.data], dt.Array):
+            return desc_a, desc_x, desc_y
+
+        size_out = _squeezed_size(out_memlet.subset)
 
         if (len(size_out) != 2 or size_out[0] != size_a[0]
                 or size_out[1] != size_a[1]):
@@ -4,6 +4,7 @@
 import numpy as np
 
 import argparse
+import functools
 import scipy
 import random
 
@@ -14,56 +15,95 @@ import dace.libraries.blas as blas
 from dace.transformation.interstate import FPGATransformSDFG, InlineSDFG
 from dace.transformation.dataflow import StreamingMemory
 
-from dace.libraries.standard.memory import aligned_ndarray
+_rng = np.random.default_rng()
 
 
-def run_test(configs, target):
+def _aligned_empty(dtype, n, alignment=256):
+    """ Allocates an uninitialized, ``alignment``-byte aligned array by
+        over-allocating once and slicing to the first aligned element. """
+    itemsize = np.dtype(dtype.type).itemsize
+    buf = np.empty(n + alignment // itemsize, dtype=dtype.type)
+    offset = (-buf.ctypes.data % alignment) // itemsize
+    return buf[offset:offset + n]
+
+
+def _random_aligned(dtype, n):
+    """ Fills an aligned buffer with values in [0, 100) directly in the
+        target data type, without an intermediate float64 array. """
+    arr = _aligned_empty(dtype, n)
+    _rng.random(dtype=dtype.type, out=arr)
+    arr *= 100
+    return arr
+
+
+@functools.lru_cache(maxsize=None)
+def _input_data(dtype, n):
+    """ Generates aligned inputs once per data type and size. The returned
+        arrays are shared between calls and must not be modified. """
+    return _random_aligned(dtype, n), _random_aligned(dtype, n)
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_program(target, veclen, dtype, size=None):
+    """ Builds and compiles the AXPY program once per target, vector width
+        and data type. Alpha is a symbol, so configs that only differ in
+        alpha share the same program. If size is given, the pure program is
+        specialized to that vector size. """
+    if target == "fpga_stream":
+        sdfg = stream_fpga_graph(veclen, dtype, "fpga")
+    elif target == "fpga_array":
+        sdfg = fpga_graph(veclen, dtype, "fpga")
+    else:
+        sdfg = pure_graph(veclen, dtype, "pure", size)
+    return sdfg.compile()
+
+
+def run_test(configs, target, specialize=False):
 
     n = int(1 << 13)
 
-    for i, config in enumerate(configs):
+    failed = []
+
+    for config in configs:
 
         a, veclen, dtype = config
 
-        x = aligned_ndarray(np.random.uniform(0, 100, n).astype(dtype.type),
-                            alignment=256)
-        y = aligned_ndarray(np.random.uniform(0, 100, n).astype(dtype.type),
-                            alignment=256)
-        y_ref = y.copy()
+        x, y_init = _input_data(dtype, n)
+        # y is updated in place, so work on a copy of the cached input
+        y = _aligned_empty(dtype, n)
+        np.copyto(y, y_init)
+        y_ref = y_init.copy()
 
         a = dtype(a)
 
         ref_result = reference_result(x, y_ref, a)
 
-        if target == "fpga_stream":
-            sdfg = stream_fpga_graph(veclen, dtype, "fpga", i)
-        elif target == "fpga_array":
-            sdfg = fpga_graph(veclen, dtype, "fpga", i)
-        else:
-            sdfg = pure_graph(veclen, dtype, "pure", i)
-        program = sdfg.compile()
+        program = _compiled_program(target, veclen, dtype,
+                                    n if specialize else None)
+
+        program(x=x, y=y, a=a, n=np.int32(n))
 
-        if target in ["fpga_stream", "fpga_array"]:
-            program(x=x, y=y, a=a, n=np.int32(n))
-            ref_norm = np.linalg.norm(y - ref_result) / n
-        else:
-            program(x=x, y=y, a=a, n=np.int32(n))
-            ref_norm = np.linalg.norm(y - ref_result) / n
+        if not np.allclose(y, ref_result, rtol=1e-5, atol=1e-5):
+            failed.append(config)
 
-        if ref_norm >= 1e-5:
-            raise ValueError(f"Failed validation for target {target}.")
+    # Run all configs before failing, so a single run reports every mismatch
+    if failed:
+        raise ValueError(f"Failed validation for target {target} with "
+                         f"configs: {failed}.")
 
 
 def reference_result(x_in, y_in, alpha):
     return scipy.linalg.blas.saxpy(x_in, y_in, a=alpha)
 
 
-def pure_graph(veclen, dtype, implementation, test_case):
+def pure_graph(veclen, dtype, implementation, size=None):
 
     n = dace.symbol("n")
     a = dace.symbol("a")
 
-    sdfg_name = f"axpy_test_{implementation}_{test_case}_w{veclen}"
+    sdfg_name = f"axpy_test_{implementation}_{dtype.ctype}_w{veclen}"
+    if size is not None:
+        sdfg_name += f"_n{size}"
 
     sdfg = dace.SDFG(sdfg_name)
     test_state = sdfg.add_state("test_state")
@@ -95,24 +135,29 @@ def pure_graph(veclen, dtype, implementation, test_case):
                                src_conn="_res",
                                memlet=Memlet(f"y[0:n/{veclen}]"))
 
+    if size is not None:
+        # n also sets the shape of x and y, so this fixes both the buffer
+        # extents and the AXPY loop bound at compile time
+        sdfg.specialize({n: size})
+
     sdfg.expand_library_nodes()
 
     return sdfg
 
 
-def test_pure():
+def test_pure(specialize=False):
     configs = [(0.5, 1, dace.float32), (1.0, 4, dace.float64)]
-    run_test(configs, "pure")
+    run_test(configs, "pure", specialize)
 
 
-def fpga_graph(veclen, dtype, test_case, expansion):
-    sdfg = pure_graph(veclen, dtype, test_case, expansion)
+def fpga_graph(veclen, dtype, implementation):
+    sdfg = pure_graph(veclen, dtype, implementation)
     sdfg.apply_transformations_repeated([FPGATransformSDFG, InlineSDFG])
     return sdfg
 
 
-def stream_fpga_graph(veclen, precision, test_case, expansion):
-    sdfg = fpga_graph(veclen, precision, test_case, expansion)
+def stream_fpga_graph(veclen, precision, implementation):
+    sdfg = fpga_graph(veclen, precision, implementation)
     sdfg.expand_library_nodes()
     sdfg.apply_transformations_repeated(
         [InlineSDFG, StreamingMemory], [{}, {
@@ -131,6 +176,11 @@ if __name__ == "__main__":
     cmdParser = argparse.ArgumentParser(allow_abbrev=False)
 
     cmdParser.add_argument("--target", dest="target", default="pure")
+    cmdParser.add_argument("--specialize",
+                           action="store_true",
+                           default=False,
+                           help="Build the pure AXPY programs for n = 8192 "
+                           "instead of a symbolic n")
 
     args = cmdParser.parse_args()
 
@@ -138,6 +188,6 @@ if __name__ == "__main__":
         _test_fpga("fpga_array")
         _test_fpga("fpga_stream")
     elif args.target == "pure":
-        test_pure()
+        test_pure(args.specialize)
     else:
         raise RuntimeError(f"Unknown target \"{args.target}\".")
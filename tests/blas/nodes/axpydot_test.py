@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
+
+import numpy as np
+
+import argparse
+import math
+
+import dace
+from dace.memlet import Memlet
+
+import dace.libraries.blas as blas
+
+from dace.transformation.interstate import FPGATransformSDFG, InlineSDFG
+from dace.transformation.dataflow import StreamingComposition, StreamingMemory
+
+
+def pure_graph(dtype, veclen, axpy_implementation, dot_implementation):
+
+    n = dace.symbol("n")
+    a = dace.symbol("a")
+
+    sdfg_name = f"axpydot_{dot_implementation}_{dtype.ctype}_w{veclen}"
+    sdfg = dace.SDFG(sdfg_name)
+
+    state = sdfg.add_state("axpydot")
+
+    vtype = dace.vector(dtype, veclen)
+
+    sdfg.add_symbol(a.name, dtype)
+
+    sdfg.add_array("x", [n / veclen], vtype)
+    sdfg.add_array("y", [n / veclen], vtype)
+    sdfg.add_array("w", [n / veclen], vtype)
+    sdfg.add_array("z", [n / veclen], vtype, transient=True)
+    sdfg.add_array("r", [1], dtype)
+
+    x = state.add_read("x")
+    y = state.add_read("y")
+    w = state.add_read("w")
+    z = state.add_access("z")
+    result = state.add_write("r")
+
+    axpy_node = blas.Axpy("axpy", a)
+    axpy_node.implementation = axpy_implementation
+
+    dot_node = blas.Dot("dot")
+    dot_node.implementation = dot_implementation
+    dot_node.n = n
+
+    state.add_memlet_path(x,
+                          axpy_node,
+                          dst_conn="_x",
+                          memlet=Memlet(f"x[0:n/{veclen}]"))
+    state.add_memlet_path(y,
+                          axpy_node,
+                          dst_conn="_y",
+                          memlet=Memlet(f"y[0:n/{veclen}]"))
+    state.add_memlet_path(axpy_node,
+                          z,
+                          src_conn="_res",
+                          memlet=Memlet(f"z[0:n/{veclen}]"))
+    state.add_memlet_path(z,
+                          dot_node,
+                          dst_conn="_x",
+                          memlet=Memlet(f"z[0:n/{veclen}]"))
+    state.add_memlet_path(w,
+                          dot_node,
+                          dst_conn="_y",
+                          memlet=Memlet(f"w[0:n/{veclen}]"))
+    state.add_memlet_path(dot_node,
+                          result,
+                          src_conn="_result",
+                          memlet=Memlet(f"r[0]"))
+
+    return sdfg
+
+
+def fpga_graph(dtype, veclen, dot_implementation):
+    sdfg = pure_graph(dtype, veclen, "fpga", dot_implementation)
+    sdfg.apply_transformations_repeated([FPGATransformSDFG, InlineSDFG])
+    sdfg.expand_library_nodes()
+    sdfg.apply_transformations_repeated([InlineSDFG])
+    # Stream the result of AXPY directly into DOT, so the intermediate vector
+    # never leaves the chip
+    composed = sdfg.apply_transformations_repeated(
+        StreamingComposition, {"storage": dace.StorageType.FPGA_Local})
+    if composed != 1:
+        raise RuntimeError("Failed to compose AXPY and DOT.")
+    sdfg.apply_transformations_repeated(
+        StreamingMemory, {"storage": dace.StorageType.FPGA_Local})
+    return sdfg
+
+
+def run_test(sdfg, size, alpha):
+
+    x = np.random.rand(size).astype(np.float32)
+    y = np.random.rand(size).astype(np.float32)
+    w = np.random.rand(size).astype(np.float32)
+    result = np.zeros(1, dtype=np.float32)
+
+    sdfg(x=x, y=y, w=w, r=result, a=alpha, n=np.int32(size))
+
+    ref = np.dot(alpha * x + y, w)
+
+    if not math.isclose(result[0], ref, rel_tol=1e-5):
+        raise ValueError("Unexpected result returned from AXPYDOT: "
+                         "got {}, expected {}".format(result[0], ref))
+
+
+def test_pure():
+    sdfg = pure_graph(dace.float32, 1, "pure", "pure")
+    run_test(sdfg, 64, np.float32(0.5))
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("N", type=int, nargs="?", default=64)
+    parser.add_argument("alpha", type=np.float32, nargs="?", default=0.5)
+    parser.add_argument("--target", dest="target", default="pure")
+    parser.add_argument("--vector-length", type=int, default=4)
+    args = parser.parse_args()
+
+    if args.target == "pure":
+        sdfg = pure_graph(dace.float32, 1, "pure", "pure")
+    elif args.target == "intel_fpga":
+        dace.Config.set("compiler", "fpga_vendor", value="intel_fpga")
+        sdfg = fpga_graph(dace.float32, args.vector_length, "FPGA_Accumulate")
+    elif args.target == "xilinx":
+        dace.Config.set("compiler", "fpga_vendor", value="xilinx")
+        sdfg = fpga_graph(dace.float32, args.vector_length,
+                          "FPGA_PartialSums")
+    else:
+        print(f"Unsupported target: {args.target}")
+        exit(-1)
+
+    run_test(sdfg, args.N, args.alpha)
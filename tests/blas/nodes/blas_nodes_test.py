@@ -35,6 +35,41 @@ def test_gemv_strided(implementation):
     assert np.allclose(daceres, reference)
 
 
+@pytest.mark.parametrize(('transposed', 'tile_size_x', 'tile_size_y'),
+                         [(False, 1, 1), (False, 7, 9), (True, 1, 1),
+                          (True, 7, 9)])
+def test_gemv_tiled(transposed, tile_size_x, tile_size_y):
+    sdfg = dace.SDFG(f'gemv_tiled_{transposed}_{tile_size_x}_{tile_size_y}')
+    x_size = M if transposed else N
+    y_size = N if transposed else M
+    sdfg.add_array('A', [M, N], dace.float64)
+    sdfg.add_array('x', [x_size], dace.float64)
+    sdfg.add_array('y', [y_size], dace.float64)
+    state = sdfg.add_state()
+
+    gemv_node = blas.Gemv('gemv', transA=transposed, alpha=2.0, beta=0)
+    gemv_node.implementation = 'pure'
+    state.add_node(gemv_node)
+    state.add_edge(state.add_read('A'), None, gemv_node, '_A',
+                   dace.Memlet('A[0:M, 0:N]'))
+    state.add_edge(state.add_read('x'), None, gemv_node, '_x',
+                   dace.Memlet(f'x[0:{x_size}]'))
+    state.add_edge(gemv_node, '_y', state.add_write('y'), None,
+                   dace.Memlet(f'y[0:{y_size}]'))
+    gemv_node.expand(sdfg,
+                     state,
+                     tile_size_x=tile_size_x,
+                     tile_size_y=tile_size_y)
+
+    A = np.random.rand(100, 60)
+    x = np.random.rand(100 if transposed else 60)
+    y = np.zeros(60 if transposed else 100)
+    reference = 2.0 * ((A.T if transposed else A) @ x)
+    sdfg(A=A, x=x, y=y, M=100, N=60)
+
+    assert np.allclose(y, reference)
+
+
 def test_dot_subset():
     @dace.program
     def dot(x: dace.float64[N, N], y: dace.float64[N, N]):
@@ -57,6 +92,7 @@ def test_dot_subset():
 @pytest.mark.parametrize(('implementation', ),
                          [('pure', ),
                           pytest.param('MKL', marks=pytest.mark.mkl),
+                          ('pure_tree', ),
                           ('OpenBLAS', ),
                           pytest.param('cuBLAS', marks=pytest.mark.gpu)])
 def test_dot_strided(implementation):
@@ -83,10 +119,162 @@ def test_dot_strided(implementation):
     assert np.allclose(daceres, reference)
 
 
+@pytest.mark.parametrize(('size', ), [(3, ), (16, ), (30, )])
+def test_dot_pure_tree(size):
+    @dace.program
+    def dot(x: dace.float64[N], y: dace.float64[N]):
+        return x @ y
+
+    x = np.random.rand(size)
+    y = np.random.rand(size)
+    reference = x @ y
+    sdfg = dot.to_sdfg()
+    sdfg.name = f'{sdfg.name}_pure_tree_{size}'
+
+    blas.default_implementation = 'pure_tree'
+    daceres = sdfg(x=x, y=y, N=size)
+
+    blas.default_implementation = None
+    assert np.allclose(daceres, reference)
+
+
+def _ger_graph(name, implementation):
+    sdfg = dace.SDFG(name)
+    sdfg.add_array('A', [M, N], dace.float64)
+    sdfg.add_array('x', [M], dace.float64)
+    sdfg.add_array('y', [N], dace.float64)
+    sdfg.add_array('res', [M, N], dace.float64)
+    state = sdfg.add_state()
+
+    ger_node = blas.Ger('ger', alpha=2.0)
+    ger_node.implementation = implementation
+    state.add_node(ger_node)
+    state.add_edge(state.add_read('A'), None, ger_node, '_A',
+                   dace.Memlet('A[0:M, 0:N]'))
+    state.add_edge(state.add_read('x'), None, ger_node, '_x',
+                   dace.Memlet('x[0:M]'))
+    state.add_edge(state.add_read('y'), None, ger_node, '_y',
+                   dace.Memlet('y[0:N]'))
+    state.add_edge(ger_node, '_res', state.add_write('res'), None,
+                   dace.Memlet('res[0:M, 0:N]'))
+
+    return ger_node, state, sdfg
+
+
+def _run_ger(sdfg):
+    A = np.random.rand(20, 30)
+    x = np.random.rand(20)
+    y = np.random.rand(30)
+    res = np.zeros_like(A)
+    reference = A + 2.0 * np.outer(x, y)
+    sdfg(A=A, x=x, y=y, res=res, M=20, N=30)
+
+    assert np.allclose(res, reference)
+
+
+@pytest.mark.parametrize(('implementation', ),
+                         [('pure', ),
+                          pytest.param('MKL', marks=pytest.mark.mkl),
+                          ('OpenBLAS', )])
+def test_ger(implementation):
+    _, _, sdfg = _ger_graph(f'ger_{implementation}', implementation)
+    _run_ger(sdfg)
+
+
+@pytest.mark.parametrize(('implementation', ),
+                         [pytest.param('MKL', marks=pytest.mark.mkl),
+                          ('OpenBLAS', )])
+def test_ger_subset(implementation):
+    sdfg = dace.SDFG(f'ger_subset_{implementation}')
+    sdfg.add_array('A', [M, N], dace.float64)
+    sdfg.add_array('X', [M, 3], dace.float64)
+    sdfg.add_array('y', [N], dace.float64)
+    sdfg.add_array('res', [M + 5, N], dace.float64)
+    state = sdfg.add_state()
+
+    # Use a column of X as the strided vector x, and write into a block of
+    # rows in the middle of res
+    ger_node = blas.Ger('ger', alpha=2.0)
+    ger_node.implementation = implementation
+    state.add_node(ger_node)
+    state.add_edge(state.add_read('A'), None, ger_node, '_A',
+                   dace.Memlet('A[0:M, 0:N]'))
+    state.add_edge(state.add_read('X'), None, ger_node, '_x',
+                   dace.Memlet('X[0:M, 1]'))
+    state.add_edge(state.add_read('y'), None, ger_node, '_y',
+                   dace.Memlet('y[0:N]'))
+    state.add_edge(ger_node, '_res', state.add_write('res'), None,
+                   dace.Memlet('res[2:M+2, 0:N]'))
+
+    A = np.random.rand(20, 30)
+    X = np.random.rand(20, 3)
+    y = np.random.rand(30)
+    res = np.zeros((25, 30))
+    reference = np.zeros_like(res)
+    reference[2:22] = A + 2.0 * np.outer(X[:, 1], y)
+    sdfg(A=A, X=X, y=y, res=res, M=20, N=30)
+
+    assert np.allclose(res, reference)
+
+
+def test_ger_fpga_streams():
+    # The FPGA expansion must accept a streamed matrix and result, e.g., when
+    # GER is composed with a producer and a consumer of A
+    sdfg = dace.SDFG('ger_fpga_streams')
+    sdfg.add_stream('A_pipe', dace.float32, storage=dace.StorageType.FPGA_Local)
+    sdfg.add_array('x', [M], dace.float32)
+    sdfg.add_array('y', [N], dace.float32)
+    sdfg.add_stream('res_pipe',
+                    dace.float32,
+                    storage=dace.StorageType.FPGA_Local)
+    state = sdfg.add_state()
+
+    ger_node = blas.Ger('ger', n=N, m=M, alpha=2.0)
+    ger_node.implementation = 'FPGA'
+    state.add_node(ger_node)
+    state.add_edge(state.add_read('A_pipe'), None, ger_node, '_A',
+                   dace.Memlet('A_pipe[0]', dynamic=True))
+    state.add_edge(state.add_read('x'), None, ger_node, '_x',
+                   dace.Memlet('x[0:M]'))
+    state.add_edge(state.add_read('y'), None, ger_node, '_y',
+                   dace.Memlet('y[0:N]'))
+    state.add_edge(ger_node, '_res', state.add_write('res_pipe'), None,
+                   dace.Memlet('res_pipe[0]', dynamic=True))
+
+    ger_node.expand(sdfg, state, tile_size_x=4, tile_size_y=4)
+
+    nsdfgs = [n for n in state.nodes() if isinstance(n, dace.nodes.NestedSDFG)]
+    assert len(nsdfgs) == 1
+    expanded = nsdfgs[0].sdfg
+    assert isinstance(expanded.arrays['_A'], dace.data.Stream)
+    assert isinstance(expanded.arrays['_res'], dace.data.Stream)
+    expanded.validate()
+
+
+@pytest.mark.parametrize(('tile_size_x', 'tile_size_y'), [(1, 1), (4, 1),
+                                                          (7, 9), (32, 32)])
+def test_ger_tiled(tile_size_x, tile_size_y):
+    ger_node, state, sdfg = _ger_graph(
+        f'ger_tiled_{tile_size_x}_{tile_size_y}', 'pure')
+    ger_node.expand(sdfg,
+                    state,
+                    tile_size_x=tile_size_x,
+                    tile_size_y=tile_size_y)
+    _run_ger(sdfg)
+
+
 if __name__ == '__main__':
     implementations = ['pure', 'MKL', 'cuBLAS']
     for implementation in implementations:
         test_gemv_strided(implementation)
+    test_gemv_tiled(True, 7, 9)
     test_dot_subset()
-    for implementation in implementations:
+    for implementation in implementations + ['pure_tree']:
         test_dot_strided(implementation)
+    for size in [3, 16, 30]:
+        test_dot_pure_tree(size)
+    for implementation in ['pure', 'MKL']:
+        test_ger(implementation)
+        test_ger_subset(implementation)
+    test_ger_fpga_streams()
+    test_ger_tiled(7, 9)
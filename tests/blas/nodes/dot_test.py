@@ -4,6 +4,7 @@
 import numpy as np
 
 import argparse
+import math
 import scipy
 
 import dace
@@ -15,9 +16,11 @@ from dace.transformation.interstate import FPGATransformSDFG, InlineSDFG
 from dace.transformation.dataflow import StreamingMemory
 
 
-def pure_graph(implementation, dtype, veclen):
+def pure_graph(implementation, dtype, veclen, size=None):
 
     sdfg_name = f"dot_{implementation}_{dtype.ctype}_w{veclen}"
+    if size is not None:
+        sdfg_name += f"_n{size}"
     sdfg = dace.SDFG(sdfg_name)
 
     state = sdfg.add_state("dot")
@@ -52,6 +55,11 @@ def pure_graph(implementation, dtype, veclen):
                           src_conn="_result",
                           memlet=Memlet(f"r[0]"))
 
+    if size is not None:
+        # For pure_tree this turns the number of full blocks and the length
+        # of the tail into constants
+        sdfg.specialize({n: size})
+
     return sdfg
 
 
@@ -72,11 +80,19 @@ if __name__ == "__main__":
     parser.add_argument("N", type=int, nargs="?", default=64)
     parser.add_argument("--target", dest="target", default="pure")
     parser.add_argument("--vector-length", type=int, default=16)
+    parser.add_argument("--specialize",
+                        action="store_true",
+                        default=False,
+                        help="Specialize the pure DOT program to the given N")
     args = parser.parse_args()
     size = args.N
 
     if args.target == "pure":
-        sdfg = pure_graph("pure", dace.float32, args.vector_length)
+        sdfg = pure_graph("pure", dace.float32, args.vector_length,
+                          size if args.specialize else None)
+    elif args.target == "pure_tree":
+        sdfg = pure_graph("pure_tree", dace.float32, 1,
+                          size if args.specialize else None)
     elif args.target == "intel_fpga":
         dace.Config.set("compiler", "fpga_vendor", value="intel_fpga")
         sdfg = fpga_graph("FPGA_Accumulate", dace.float32, args.vector_length)
@@ -102,7 +118,6 @@ if __name__ == "__main__":
 
     ref = scipy.linalg.blas.sdot(x, y)
 
-    diff = abs(result[0] - ref)
-    if diff >= 1e-6 * ref:
+    if not math.isclose(result[0], ref, rel_tol=1e-6):
         raise ValueError("Unexpected result returned from dot product: "
               "got {}, expected {}".format(result[0], ref))
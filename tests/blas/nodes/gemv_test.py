@@ -102,7 +102,10 @@ if __name__ == "__main__":
     transposed = args.transposed
     if args.target == "pure":
         sdfg = pure_graph(dace.float32, transposed, "pure", args.vectorize,
-                          alpha, beta)
+                          alpha, beta, {
+                              "tile_size_x": args.tile_size_x,
+                              "tile_size_y": args.tile_size_y
+                          })
     elif args.target == "tiles_by_column":
         if not transposed and args.vectorize > 1:
             raise NotImplementedError(
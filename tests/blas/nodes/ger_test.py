@@ -4,6 +4,7 @@
 from dace.transformation.dataflow.streaming_memory import StreamingMemory
 from dace.transformation.interstate.sdfg_nesting import InlineSDFG
 from dace.transformation.interstate.fpga_transform_sdfg import FPGATransformSDFG
+from dace.transformation.auto.fpga import fpga_rr_interleave_containers_to_banks
 import numpy as np
 
 import argparse
@@ -63,10 +64,16 @@ def fpga_graph(dtype, veclen, tile_size_x, tile_size_y):
     ger_node, state, sdfg = pure_graph("FPGA", dtype, veclen)
     ger_node.expand(sdfg, state, tile_size_x=tile_size_x, tile_size_y=tile_size_y)
     sdfg.apply_transformations_repeated([FPGATransformSDFG, InlineSDFG])
+    # Spread A, res, x and y across the off-chip banks so that the reads of A
+    # and the writes of res use separate memory interfaces
+    fpga_rr_interleave_containers_to_banks(sdfg)
     sdfg.expand_library_nodes()
     sdfg.apply_transformations_repeated(
         [InlineSDFG, StreamingMemory], [{}, {
-            "storage": dace.StorageType.FPGA_Local
+            "storage":
+            dace.StorageType.FPGA_Local,
+            "buffer_size":
+            dace.Config.get("library", "blas", "fpga", "default_stream_depth")
         }])
     return sdfg
 
@@ -117,7 +124,10 @@ if __name__ == "__main__":
 
     if args.target == "pure":
         ger_node, state, sdfg = pure_graph("pure", dace.float32, veclen)
-        ger_node.expand(sdfg, state)
+        ger_node.expand(sdfg,
+                        state,
+                        tile_size_x=tile_size_x,
+                        tile_size_y=tile_size_y)
         sdfg.apply_transformations_repeated([InlineSDFG])
     elif args.target == "fpga":
         sdfg = fpga_graph(dace.float32, veclen, tile_size_x, tile_size_y)
@@ -57,9 +57,12 @@ TESTS = [
     ("tests/fpga/unique_nested_sdfg_fpga.py", "two_vecAdd", []),
     ### BLAS ###
     ("tests/blas/nodes/axpy_test.py",
-     ["axpy_test_fpga_0_w1_1", "axpy_test_fpga_1_w4_1"], ["--target", "fpga"]),
+     ["axpy_test_fpga_float_w1_1", "axpy_test_fpga_double_w4_1"],
+     ["--target", "fpga"]),
     ("tests/blas/nodes/dot_test.py", "dot_FPGA_Accumulate_float_w16_1",
      ["--target", "intel_fpga"]),
+    ("tests/blas/nodes/axpydot_test.py", "axpydot_FPGA_Accumulate_float_w4_1",
+     ["--target", "intel_fpga"]),
     ("tests/blas/nodes/gemv_test.py", "gemv_FPGA_TilesByColumn_float_True_w4_1",
      ["--target", "tiles_by_column", "--transpose", "--vectorize", 4]),
     ("tests/blas/nodes/gemv_test.py", "gemv_FPGA_Accumulate_float_False_w4_1",
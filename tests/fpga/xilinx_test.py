@@ -43,10 +43,12 @@ TESTS = [
     ("tests/transformations/mapfusion_fpga.py",
      ["multiple_fusions_1", "fusion_with_transient_1"], True, False, []),
     # BLAS
-    ("tests/blas/nodes/axpy_test.py", "axpy_test_fpga_1_w4_1", True, True,
+    ("tests/blas/nodes/axpy_test.py", "axpy_test_fpga_double_w4_1", True, True,
      ["--target", "fpga"]),
     ("tests/blas/nodes/dot_test.py", "dot_FPGA_PartialSums_float_w16_1", True,
      True, ["--target", "xilinx"]),
+    ("tests/blas/nodes/axpydot_test.py", "axpydot_FPGA_PartialSums_float_w4_1",
+     True, False, ["--target", "xilinx"]),
     ("tests/blas/nodes/gemv_test.py", "gemv_FPGA_TilesByColumn_float_True_w4_1",
      True, True,
      ["--target", "tiles_by_column", "--transpose", "--vectorize", "4"]),